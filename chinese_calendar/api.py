@@ -2,18 +2,24 @@
 from __future__ import absolute_import, unicode_literals
 
 import datetime
+import functools
+import io
+import itertools
 import json
 import os
+import socket
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from typing import Callable, Dict, List, Optional
-from urllib.parse import parse_qs, urlparse
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlsplit
 
 from chinese_calendar import __version__
+from chinese_calendar.constants import holidays, in_lieu_days, workdays
 from chinese_calendar.utils import (
     get_a_share_trading_days,
-    get_dates,
     get_holiday_detail,
     get_holidays,
     get_interbank_trading_days,
@@ -33,8 +39,151 @@ TYPE_CHECKERS: Dict[str, Callable[[datetime.date], bool]] = {
     "interbank-trading-day": is_interbank_trading_day,
     "a-share-trading-day": is_a_share_trading_day,
 }
+_SUPPORTED_TYPES = ", ".join(sorted(TYPE_CHECKERS))
+
+_FIRST_DAY = datetime.date(min(holidays).year, 1, 1)
+_LAST_DAY = datetime.date(max(holidays).year, 12, 31)
+_BASE = _FIRST_DAY.toordinal()
+_SPAN = _LAST_DAY.toordinal() - _BASE + 1
+
+
+def _build_lookup_tables() -> Dict[Callable[[datetime.date], bool], bytes]:
+    """
+    Precompute one byte per supported day for each judgement, indexed by ``date.toordinal() - _BASE``,
+    so the API answers from a table instead of re-validating and probing the constants for every date.
+    """
+    workday, in_lieu, a_share = bytearray(_SPAN), bytearray(_SPAN), bytearray(_SPAN)
+    for offset in range(_SPAN):
+        date = datetime.date.fromordinal(_BASE + offset)
+        weekday = date.weekday()
+        workday[offset] = date in workdays or (weekday <= 4 and date not in holidays)
+        in_lieu[offset] = date in in_lieu_days
+        a_share[offset] = workday[offset] and weekday < 5
+    return {
+        is_workday: bytes(workday),
+        is_holiday: bytes(1 - flag for flag in workday),
+        is_in_lieu: bytes(in_lieu),
+        is_interbank_trading_day: bytes(workday),
+        is_a_share_trading_day: bytes(a_share),
+    }
+
+
+_LOOKUP_TABLES = _build_lookup_tables()
+_ISO_DATES = [datetime.date.fromordinal(_BASE + offset).isoformat() for offset in range(_SPAN)]
+_ISO_DATE_BYTES = [iso.encode("ascii") for iso in _ISO_DATES]
+# holiday name per day, resolved in the same order as get_holiday_detail (make-up workdays first)
+_HOLIDAY_NAMES = [
+    workdays.get(date, holidays.get(date)) for date in map(datetime.date.fromordinal, range(_BASE, _BASE + _SPAN))
+]
+_STATUTORY_HOLIDAYS = bytes(datetime.date.fromordinal(_BASE + offset) in holidays for offset in range(_SPAN))
+
+# range helpers keyed by (func, include_weekends), pointing at the table that selects the same days
+_RANGE_TABLES: Dict[Tuple[Callable[..., List[datetime.date]], bool], bytes] = {
+    (get_holidays, True): _LOOKUP_TABLES[is_holiday],
+    (get_holidays, False): _STATUTORY_HOLIDAYS,
+    (get_workdays, True): _LOOKUP_TABLES[is_workday],
+    (get_workdays, False): _LOOKUP_TABLES[is_a_share_trading_day],
+    (get_interbank_trading_days, True): _LOOKUP_TABLES[is_interbank_trading_day],
+    (get_a_share_trading_days, True): _LOOKUP_TABLES[is_a_share_trading_day],
+}
+
+
+def _lookup(table: bytes, func: Callable[[datetime.date], bool], date: datetime.date) -> bool:
+    offset = date.toordinal() - _BASE
+    if 0 <= offset < _SPAN:
+        return bool(table[offset])
+    return func(date)  # out of the supported range, let the library raise its usual error
+
+
+def _lookup_range(table: bytes, start: datetime.date, end: datetime.date) -> Optional[List[str]]:
+    """Select the ISO dates flagged in ``table`` between start and end, or None if the range is not covered."""
+    low, high = start.toordinal() - _BASE, end.toordinal() - _BASE + 1
+    if low < 0 or high > _SPAN:
+        return None
+    return list(itertools.compress(_ISO_DATES[low:high], table[low:high]))
+
 
+# built once so every response reuses the same C-accelerated encoder with compact separators
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
 
+
+def _encode(payload: Union[Dict, bytes]) -> bytes:
+    if isinstance(payload, bytes):
+        return payload  # handlers may hand back an already rendered JSON body
+    return _JSON_ENCODER.encode(payload).encode("utf-8")
+
+
+# a parameter given once maps to its string, a repeated parameter to the list of its values
+_Query = Dict[str, Union[str, List[str]]]
+
+
+class _ResponseCache:
+    """
+    LRU of encoded 200 responses keyed by ``(path, query string)``, bounded by total body bytes rather than
+    entry count. Bodies larger than ``max_body`` are never stored, so a few wide ranges cannot fill it.
+    """
+
+    def __init__(self, max_bytes: int, max_body: int):
+        self._entries: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._size = 0
+        self._max_bytes = max_bytes
+        self._max_body = max_body
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, key: Tuple[str, str], body: bytes):
+        if len(body) > self._max_body:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = body
+            self._size += len(body)
+            while self._size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+
+_RESPONSE_CACHE = _ResponseCache(max_bytes=32 * 1024 * 1024, max_body=64 * 1024)
+
+_MAX_BODY_SIZE = 1024 * 1024  # largest POST body accepted, in bytes
+_MAX_BATCH_ITEMS = 100  # each item may expand to a full-span response, so bound the fan-out of one POST
+
+_EMPTY_QUERY: _Query = {}  # shared by every request without a query string; handlers only read it
+
+
+def _parse_query(query: str) -> _Query:
+    parsed: _Query = {}
+    for key, value in parse_qsl(query):
+        existing = parsed.get(key)
+        if existing is None:
+            parsed[key] = value
+        elif isinstance(existing, list):
+            existing.append(value)
+        else:
+            parsed[key] = [existing, value]
+    return parsed
+
+
+def _as_list(value: Union[None, str, List[str]]) -> List[str]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _as_scalar(value: Union[None, str, List[str]]) -> Optional[str]:
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+@functools.lru_cache(maxsize=8192)
 def _parse_date(value: str) -> datetime.date:
     try:
         return datetime.date.fromisoformat(value)
@@ -42,70 +191,125 @@ def _parse_date(value: str) -> datetime.date:
         raise ValueError(f"Invalid date format: {value}. Expected YYYY-MM-DD.")
 
 
-def _collect_dates(dates: Optional[List[str]], start: Optional[str], end: Optional[str]) -> List[datetime.date]:
+def _collect_ordinals(query: _Query) -> Iterable[int]:
+    """
+    Resolve ``dates`` or ``start``/``end`` to date ordinals. A range stays a lazy ``range``, so handlers
+    reading the lookup tables never materialize a datetime.date per day.
+    """
+    dates, start, end = _as_list(query.get("dates")), _as_scalar(query.get("start")), _as_scalar(query.get("end"))
     if dates:
-        return [_parse_date(d) for d in dates]
+        return [_parse_date(d).toordinal() for d in dates]
     if start and end:
         start_date, end_date = _parse_date(start), _parse_date(end)
         if end_date < start_date:
             raise ValueError("end date must not be earlier than start date")
-        return get_dates(start_date, end_date)
+        return range(start_date.toordinal(), end_date.toordinal() + 1)
     raise ValueError("Provide either repeated 'dates' parameters or both 'start' and 'end'.")
 
 
-def _health_handler(_: Dict[str, List[str]]):
-    return {"status": "ok", "version": __version__}
+_HEALTH_RESPONSE = _encode({"status": "ok", "version": __version__})
 
 
-def _flag_handler(func: Callable[[datetime.date], bool], key: str) -> Callable[[Dict[str, List[str]]], Dict]:
-    def handler(query: Dict[str, List[str]]):
-        dates = _collect_dates(query.get("dates"), query.get("start", [None])[0], query.get("end", [None])[0])
-        return {"results": [{"date": date.isoformat(), key: func(date)} for date in dates]}
+def _health_handler(_: _Query):
+    return _HEALTH_RESPONSE
 
-    return handler
 
+_JSON_BOOLS = (b"false", b"true")
 
-def _holiday_detail_handler(query: Dict[str, List[str]]):
-    dates = _collect_dates(query.get("dates"), query.get("start", [None])[0], query.get("end", [None])[0])
+
+def _flag_results(query: _Query, func: Callable[[datetime.date], bool], template: bytes) -> bytes:
+    """
+    Render a flag endpoint's ``{"results": [...]}`` body directly, formatting each date into the endpoint's
+    fixed ``%``-template instead of building dicts for the generic JSON encoder.
+    """
+    table = _LOOKUP_TABLES[func]
     results = []
-    for date in dates:
-        is_holiday_flag, name = get_holiday_detail(date)
-        results.append({"date": date.isoformat(), "is_holiday": is_holiday_flag, "holiday_name": name})
+    for ordinal in _collect_ordinals(query):
+        offset = ordinal - _BASE
+        if 0 <= offset < _SPAN:
+            results.append(template % (_ISO_DATE_BYTES[offset], _JSON_BOOLS[table[offset]]))
+        else:
+            date = datetime.date.fromordinal(ordinal)
+            results.append(template % (date.isoformat().encode("ascii"), _JSON_BOOLS[func(date)]))
+    return b'{"results":[' + b",".join(results) + b"]}"
+
+
+def _workday_handler(query: _Query):
+    return _flag_results(query, is_workday, b'{"date":"%s","is_workday":%s}')
+
+
+def _holiday_handler(query: _Query):
+    return _flag_results(query, is_holiday, b'{"date":"%s","is_holiday":%s}')
+
+
+def _in_lieu_handler(query: _Query):
+    return _flag_results(query, is_in_lieu, b'{"date":"%s","is_in_lieu":%s}')
+
+
+def _interbank_handler(query: _Query):
+    return _flag_results(query, is_interbank_trading_day, b'{"date":"%s","is_interbank_trading_day":%s}')
+
+
+def _a_share_handler(query: _Query):
+    return _flag_results(query, is_a_share_trading_day, b'{"date":"%s","is_a_share_trading_day":%s}')
+
+
+def _holiday_detail_handler(query: _Query):
+    table = _LOOKUP_TABLES[is_holiday]
+    results = []
+    for ordinal in _collect_ordinals(query):
+        offset = ordinal - _BASE
+        if 0 <= offset < _SPAN:
+            iso, is_holiday_flag, name = _ISO_DATES[offset], bool(table[offset]), _HOLIDAY_NAMES[offset]
+        else:
+            date = datetime.date.fromordinal(ordinal)
+            iso, (is_holiday_flag, name) = date.isoformat(), get_holiday_detail(date)
+        results.append({"date": iso, "is_holiday": is_holiday_flag, "holiday_name": name})
     return {"results": results}
 
 
-def _type_check_handler(query: Dict[str, List[str]]):
-    date_value = query.get("date", [None])[0]
+def _type_check_handler(query: _Query):
+    date_value = _as_scalar(query.get("date"))
     if not date_value:
         raise ValueError("'date' query parameter is required for this endpoint.")
 
-    type_value = query.get("type", [None])[0]
+    type_value = _as_scalar(query.get("type"))
     if not type_value:
         raise ValueError("'type' query parameter is required for this endpoint.")
 
-    try:
-        checker = TYPE_CHECKERS[type_value]
-    except KeyError:
-        supported = ", ".join(sorted(TYPE_CHECKERS.keys()))
-        raise ValueError(f"Unknown type '{type_value}'. Supported types: {supported}.")
+    checker = TYPE_CHECKERS.get(type_value)
+    if checker is None:
+        raise ValueError(f"Unknown type '{type_value}'. Supported types: {_SUPPORTED_TYPES}.")
 
     date = _parse_date(date_value)
-    return {"date": date.isoformat(), "type": type_value, "result": checker(date)}
+    return {"date": date.isoformat(), "type": type_value, "result": _lookup(_LOOKUP_TABLES[checker], checker, date)}
+
+
+_BOOL_VALUES = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "on": True,
+    "false": False,
+    "0": False,
+    "no": False,
+    "off": False,
+}
 
 
 def _parse_bool(value: Optional[str], default: bool = True) -> bool:
     if value is None:
         return default
-    lowered = value.lower()
-    if lowered in {"true", "1", "yes", "on"}:
-        return True
-    if lowered in {"false", "0", "no", "off"}:
-        return False
-    raise ValueError("Boolean parameters accept true/false/1/0/yes/no/on/off")
+    result = _BOOL_VALUES.get(value)
+    if result is None:
+        result = _BOOL_VALUES.get(value.lower())
+    if result is None:
+        raise ValueError("Boolean parameters accept true/false/1/0/yes/no/on/off")
+    return result
 
 
-def _range_required(query: Dict[str, List[str]]):
-    start, end = query.get("start", [None])[0], query.get("end", [None])[0]
+def _range_required(query: _Query):
+    start, end = _as_scalar(query.get("start")), _as_scalar(query.get("end"))
     if not start or not end:
         raise ValueError("'start' and 'end' query parameters are required for this endpoint.")
     start_date, end_date = _parse_date(start), _parse_date(end)
@@ -117,30 +321,40 @@ def _range_required(query: Dict[str, List[str]]):
 def _range_list_handler(
     func: Callable[..., List[datetime.date]], key: str, include_weekends_supported: bool = False
 ):
-    def handler(query: Dict[str, List[str]]):
+    def handler(query: _Query):
         start, end = _range_required(query)
-        include_weekends_param = query.get("include_weekends", [None])[0]
+        include_weekends_param = _as_scalar(query.get("include_weekends"))
         include_weekends = _parse_bool(include_weekends_param, default=True) if include_weekends_supported else True
-        days = func(start, end, include_weekends) if include_weekends_supported else func(start, end)
-        return {key: [day.isoformat() for day in days]}
+        days = _lookup_range(_RANGE_TABLES[func, include_weekends], start, end)
+        if days is None:
+            dates = func(start, end, include_weekends) if include_weekends_supported else func(start, end)
+            days = [date.isoformat() for date in dates]
+        return {key: days}
 
     return handler
 
 
 class _CalendarRequestHandler(BaseHTTPRequestHandler):
-    routes: Dict[str, Callable[[Dict[str, List[str]]], Dict]] = {
+    protocol_version = "HTTP/1.1"  # every response carries Content-Length, so connections can be reused
+    server_version = f"chinese-calendar/{__version__}"
+    # buffer the status line, headers and body so a small response leaves in one write;
+    # BaseHTTPRequestHandler flushes wfile after every request
+    wbufsize = io.DEFAULT_BUFFER_SIZE
+    # a keep-alive connection waiting for its next request holds a worker, so idle ones are closed quickly;
+    # once a request has started arriving, reading it gets the longer ``timeout``
+    keep_alive_timeout = 2
+    timeout = 30
+    routes: Dict[str, Callable[[_Query], Union[Dict, bytes]]] = {
         "/api/health": _health_handler,
-        "/api/workdays": _flag_handler(is_workday, "is_workday"),
-        "/api/holidays": _flag_handler(is_holiday, "is_holiday"),
-        "/api/in-lieu": _flag_handler(is_in_lieu, "is_in_lieu"),
+        "/api/workdays": _workday_handler,
+        "/api/holidays": _holiday_handler,
+        "/api/in-lieu": _in_lieu_handler,
         "/api/holiday/detail": _holiday_detail_handler,
         "/api/date/type": _type_check_handler,
         "/api/holidays/range": _range_list_handler(get_holidays, "holidays", include_weekends_supported=True),
         "/api/workdays/range": _range_list_handler(get_workdays, "workdays", include_weekends_supported=True),
-        "/api/interbank/trading-days": _flag_handler(
-            is_interbank_trading_day, "is_interbank_trading_day"
-        ),
-        "/api/a-share/trading-days": _flag_handler(is_a_share_trading_day, "is_a_share_trading_day"),
+        "/api/interbank/trading-days": _interbank_handler,
+        "/api/a-share/trading-days": _a_share_handler,
         "/api/interbank/trading-days/list": _range_list_handler(
             get_interbank_trading_days, "interbank_trading_days"
         ),
@@ -149,40 +363,196 @@ class _CalendarRequestHandler(BaseHTTPRequestHandler):
         ),
     }
 
-    def _json_response(self, status: HTTPStatus, payload: Dict):
-        response = json.dumps(payload).encode("utf-8")
+    @classmethod
+    def _batch(cls, body: bytes) -> bytes:
+        """Run ``[{"endpoint": "/api/...", "<param>": value | [values]}, ...]`` and return results in input order."""
+        try:
+            items = json.loads(body)
+        except ValueError:
+            raise ValueError("Batch request body must be a JSON array.")
+        if not isinstance(items, list):
+            raise ValueError("Batch request body must be a JSON array.")
+        if len(items) > _MAX_BATCH_ITEMS:
+            raise ValueError(f"Batch request accepts at most {_MAX_BATCH_ITEMS} items, got {len(items)}.")
+        results = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict) or not isinstance(item.get("endpoint"), str):
+                raise ValueError(f"Batch item {index} must be an object with an 'endpoint' string.")
+            query = {
+                key: [str(v) for v in value] if isinstance(value, list) else str(value)
+                for key, value in item.items()
+                if key != "endpoint"
+            }
+            status, payload = cls._dispatch(item["endpoint"], query)
+            if status is not HTTPStatus.OK:
+                raise ValueError(f"Batch item {index} ({item['endpoint']}): {payload['detail']}")
+            results.append(_encode(payload))
+        return b'{"results":[' + b",".join(results) + b"]}"
+
+    @classmethod
+    def _render(cls, path: str, query: str) -> Tuple[HTTPStatus, bytes]:
+        """
+        Dispatch and serialize one GET request. Every route is a pure function of its query string over the
+        holiday data bundled at import time, so successful responses are cached until the process restarts.
+        """
+        key = (path, query)
+        response = _RESPONSE_CACHE.get(key)
+        if response is not None:
+            return HTTPStatus.OK, response
+        status, payload = cls._dispatch(path, _parse_query(query) if query else _EMPTY_QUERY)
+        response = _encode(payload)
+        if status is HTTPStatus.OK:
+            _RESPONSE_CACHE.put(key, response)
+        return status, response
+
+    def _json_response(self, status: HTTPStatus, response: bytes):
         self.send_response(status.value)
         self.send_header("Content-Type", "application/json; charset=utf-8")
         self.send_header("Content-Length", str(len(response)))
+        if not self.close_connection and self.server.saturated():
+            self.close_connection = True  # give the worker back rather than keep the connection on a full pool
+        self.send_header("Connection", "close" if self.close_connection else "keep-alive")
         self.end_headers()
         self.wfile.write(response)
 
+    def setup(self):
+        super().setup()
+        self.handled_requests = 0
+
+    def handle_one_request(self):
+        if self.handled_requests:
+            # only the wait between keep-alive requests is short; the first request line gets ``timeout``
+            self.connection.settimeout(self.keep_alive_timeout)
+            try:
+                pending = self.rfile.peek(1)
+            except OSError:  # includes socket.timeout
+                pending = b""
+            if not pending:
+                self.close_connection = True
+                return
+            self.connection.settimeout(self.timeout)
+        self.handled_requests += 1
+        super().handle_one_request()
+
+    def handle_expect_100(self):
+        # the interim "100 Continue" must reach the client now, not sit in wfile until the final response
+        result = super().handle_expect_100()
+        self.wfile.flush()
+        return result
+
+    def _reject_body(self, status: HTTPStatus, detail: str):
+        # the unread body would be parsed as the next request, so this connection cannot be reused
+        self.close_connection = True
+        self._json_response(status, _encode({"detail": detail}))
+
+    def version_string(self):
+        return self.server_version
+
     def log_message(self, format, *args):
         return  # silence default logging
 
-    def do_GET(self):  # noqa: N802
-        parsed = urlparse(self.path)
-        handler = self.routes.get(parsed.path)
+    @classmethod
+    def _dispatch(cls, path: str, query: _Query) -> Tuple[HTTPStatus, Union[Dict, bytes]]:
+        """Resolve a route to ``(status, payload)``, independent of the transport serving it."""
+        handler = _ROUTE_DISPATCH.get(path)
         if not handler:
-            self._json_response(HTTPStatus.NOT_FOUND, {"detail": "Not Found"})
-            return
+            return HTTPStatus.NOT_FOUND, {"detail": "Not Found"}
         try:
-            payload = handler(parse_qs(parsed.query))
+            return HTTPStatus.OK, handler(query)
         except ValueError as exc:
-            self._json_response(HTTPStatus.BAD_REQUEST, {"detail": str(exc)})
+            return HTTPStatus.BAD_REQUEST, {"detail": str(exc)}
+
+    def _split_target(self) -> Tuple[str, str]:
+        """Split the request target into ``(path, query string)``, dropping any fragment."""
+        target = self.path.partition("#")[0]
+        if not target.startswith("/"):  # absolute-form, e.g. "GET http://host/api/health" sent through a proxy
+            parsed = urlsplit(target)
+            return parsed.path, parsed.query
+        path, _, query = target.partition("?")
+        return path, query
+
+    def do_GET(self):  # noqa: N802
+        path, query = self._split_target()
+        self._json_response(*self._render(path, query))
+
+    def do_POST(self):  # noqa: N802
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length < 0:
+                raise ValueError(length)
+        except ValueError:
+            self._reject_body(HTTPStatus.BAD_REQUEST, "Invalid Content-Length header.")
+            return
+        if length > _MAX_BODY_SIZE:
+            self._reject_body(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Request body exceeds {_MAX_BODY_SIZE} bytes.")
             return
-        self._json_response(HTTPStatus.OK, payload)
+        body = self.rfile.read(length)
+        if self._split_target()[0] != "/api/batch":
+            self._json_response(HTTPStatus.NOT_FOUND, _encode({"detail": "Not Found"}))
+            return
+        try:
+            status, payload = HTTPStatus.OK, self._batch(body)
+        except ValueError as exc:
+            status, payload = HTTPStatus.BAD_REQUEST, {"detail": str(exc)}
+        self._json_response(status, _encode(payload))
+
+
+_ROUTE_DISPATCH = _CalendarRequestHandler.routes
+
+
+class _CalendarHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that serves connections from a bounded thread pool instead of one thread each."""
+
+    def __init__(self, server_address, handler_class, workers: Optional[int] = None):
+        super().__init__(server_address, handler_class)
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)  # ThreadPoolExecutor's default
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="chinese-calendar")
+        self._connections = set()
+        self._connections_lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        with self._connections_lock:
+            self._connections.add(request)
+        self._executor.submit(self.process_request_thread, request, client_address)
+
+    def saturated(self) -> bool:
+        """Whether every worker holds a connection, so keeping one alive would make new clients queue."""
+        with self._connections_lock:
+            return len(self._connections) >= self.workers
+
+    def shutdown_request(self, request):
+        with self._connections_lock:
+            self._connections.discard(request)
+        super().shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        # wake workers blocked on idle keep-alive connections, so the pool drains instead of delaying exit
+        with self._connections_lock:
+            for connection in self._connections:
+                try:
+                    connection.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+        self._executor.shutdown(wait=False)
+
 
+def create_server(host: str = "0.0.0.0", port: int = 8000, workers: Optional[int] = None) -> ThreadingHTTPServer:
+    """
+    Create the API server without starting it.
 
-def create_server(host: str = "0.0.0.0", port: int = 8000) -> ThreadingHTTPServer:
-    return ThreadingHTTPServer((host, port), _CalendarRequestHandler)
+    ``workers`` bounds how many connections are served at once; extra connections wait in the queue instead of
+    spawning more threads. Defaults to ThreadPoolExecutor's ``min(32, os.cpu_count() + 4)``.
+    """
+    return _CalendarHTTPServer((host, port), _CalendarRequestHandler, workers=workers)
 
 
-def run(host: str = "0.0.0.0", port: int = 8000):
+def run(host: str = "0.0.0.0", port: int = 8000, workers: Optional[int] = None):
     """Run the API service with the built-in HTTP server."""
     host = os.getenv("CHINESE_CALENDAR_HOST", host)
     port = int(os.getenv("CHINESE_CALENDAR_PORT", port))
-    server = create_server(host, port)
+    workers = int(os.getenv("CHINESE_CALENDAR_WORKERS", 0)) or workers
+    server = create_server(host, port, workers)
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
     try:
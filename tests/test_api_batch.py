@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+
+import http.client
+import json
+import socket
+import threading
+import unittest
+import urllib.error
+import urllib.request
+
+from chinese_calendar.api import _MAX_BATCH_ITEMS, create_server
+
+
+class APIBatchTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = create_server(host="127.0.0.1", port=0)
+        cls.port = cls.server.server_address[1]
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.thread.join(timeout=1)
+
+    def _post(self, path: str, body: bytes):
+        request = urllib.request.Request(f"http://127.0.0.1:{self.port}{path}", data=body, method="POST")
+        return urllib.request.urlopen(request)
+
+    def test_batch_keeps_input_order(self):
+        body = [
+            {"endpoint": "/api/holidays", "dates": ["2018-02-11", "2018-02-16"]},
+            {"endpoint": "/api/date/type", "date": "2018-02-16", "type": "workday"},
+            {"endpoint": "/api/workdays/range", "start": "2018-02-10", "end": "2018-02-12", "include_weekends": False},
+        ]
+        response = self._post("/api/batch", json.dumps(body).encode("utf-8"))
+        payload = json.loads(response.read().decode("utf-8"))["results"]
+        self.assertEqual(
+            payload[0]["results"],
+            [{"date": "2018-02-11", "is_holiday": False}, {"date": "2018-02-16", "is_holiday": True}],
+        )
+        self.assertFalse(payload[1]["result"])
+        self.assertEqual(payload[2], {"workdays": ["2018-02-12"]})
+
+    def test_batch_rejects_invalid_items(self):
+        for body in (b"not json", b"{}", b'[{"dates": ["2018-02-11"]}]', b'[{"endpoint": "/api/unknown"}]'):
+            with self.assertRaises(urllib.error.HTTPError) as exc:
+                self._post("/api/batch", body)
+            self.assertEqual(exc.exception.code, 400, body)
+
+    def test_batch_rejects_too_many_items(self):
+        item = {"endpoint": "/api/holiday/detail", "start": "2004-01-01", "end": "2026-12-31"}
+        body = json.dumps([item] * (_MAX_BATCH_ITEMS + 1)).encode("utf-8")
+        with self.assertRaises(urllib.error.HTTPError) as exc:
+            self._post("/api/batch", body)
+        self.assertEqual(exc.exception.code, 400)
+        self.assertIn(str(_MAX_BATCH_ITEMS), json.loads(exc.exception.read())["detail"])
+
+    def _post_with_length(self, length: str):
+        connection = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+        try:
+            connection.putrequest("POST", "/api/batch")
+            connection.putheader("Content-Length", length)
+            connection.endheaders()
+            response = connection.getresponse()
+            return response.status, json.loads(response.read()), response.getheader("Connection")
+        finally:
+            connection.close()
+
+    def test_batch_rejects_invalid_content_length(self):
+        for length in ("-1", "abc"):
+            status, payload, connection = self._post_with_length(length)
+            self.assertEqual(status, 400, length)
+            self.assertEqual(payload["detail"], "Invalid Content-Length header.")
+            self.assertEqual(connection, "close")
+
+    def test_batch_rejects_oversized_body(self):
+        status, payload, connection = self._post_with_length("50000000000")
+        self.assertEqual(status, 413)
+        self.assertIn("detail", payload)
+        self.assertEqual(connection, "close")
+
+    def test_batch_answers_expect_100_continue(self):
+        body = b'[{"endpoint": "/api/health"}]'
+        with socket.create_connection(("127.0.0.1", self.port), timeout=5) as connection:
+            connection.sendall(
+                b"POST /api/batch HTTP/1.1\r\nHost: 127.0.0.1\r\nExpect: 100-continue\r\n"
+                b"Content-Length: %d\r\nConnection: close\r\n\r\n" % len(body)
+            )
+            self.assertTrue(connection.recv(1024).startswith(b"HTTP/1.1 100 Continue\r\n"))
+            connection.sendall(body)
+            response = b""
+            while True:
+                chunk = connection.recv(4096)
+                if not chunk:
+                    break
+                response += chunk
+        self.assertTrue(response.startswith(b"HTTP/1.1 200 "))
+        self.assertIn(b'"status":"ok"', response)
+
+    def test_post_to_other_path_is_not_found(self):
+        with self.assertRaises(urllib.error.HTTPError) as exc:
+            self._post("/api/workdays", b"[]")
+        self.assertEqual(exc.exception.code, 404)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+
+import unittest
+from http import HTTPStatus
+
+from chinese_calendar.api import (
+    _RESPONSE_CACHE,
+    _CalendarRequestHandler,
+    _ResponseCache,
+)
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def test_evicts_least_recently_used_by_total_bytes(self):
+        cache = _ResponseCache(max_bytes=10, max_body=10)
+        cache.put(("/a", ""), b"aaaa")
+        cache.put(("/b", ""), b"bbbb")
+        self.assertEqual(cache.get(("/a", "")), b"aaaa")
+        cache.put(("/c", ""), b"cccc")
+        self.assertIsNone(cache.get(("/b", "")))
+        self.assertEqual(cache.get(("/a", "")), b"aaaa")
+        self.assertEqual(cache.get(("/c", "")), b"cccc")
+
+    def test_skips_oversized_bodies(self):
+        cache = _ResponseCache(max_bytes=100, max_body=4)
+        cache.put(("/a", ""), b"aaaaa")
+        self.assertIsNone(cache.get(("/a", "")))
+
+    def test_render_caches_only_successful_responses(self):
+        status, _ = _CalendarRequestHandler._render("/api/not-a-route", "")
+        self.assertIs(status, HTTPStatus.NOT_FOUND)
+        self.assertIsNone(_RESPONSE_CACHE.get(("/api/not-a-route", "")))
+
+        status, _ = _CalendarRequestHandler._render("/api/workdays", "dates=not-a-date")
+        self.assertIs(status, HTTPStatus.BAD_REQUEST)
+        self.assertIsNone(_RESPONSE_CACHE.get(("/api/workdays", "dates=not-a-date")))
+
+        status, response = _CalendarRequestHandler._render("/api/workdays", "dates=2018-02-11")
+        self.assertIs(status, HTTPStatus.OK)
+        self.assertEqual(_RESPONSE_CACHE.get(("/api/workdays", "dates=2018-02-11")), response)
+
+    def test_render_skips_full_span_bodies(self):
+        query = "start=2004-01-01&end=2026-12-31"
+        status, response = _CalendarRequestHandler._render("/api/holiday/detail", query)
+        self.assertIs(status, HTTPStatus.OK)
+        self.assertGreater(len(response), 64 * 1024)
+        self.assertIsNone(_RESPONSE_CACHE.get(("/api/holiday/detail", query)))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+
+import datetime
+import unittest
+
+from chinese_calendar.api import (
+    _FIRST_DAY,
+    _LAST_DAY,
+    _LOOKUP_TABLES,
+    _RANGE_TABLES,
+    _holiday_detail_handler,
+    _lookup,
+    _lookup_range,
+)
+from chinese_calendar.utils import (
+    get_dates,
+    get_holiday_detail,
+    get_holidays,
+    get_workdays,
+    is_workday,
+)
+
+
+class LookupTableTests(unittest.TestCase):
+    def test_tables_match_judgements(self):
+        for func, table in _LOOKUP_TABLES.items():
+            for date in get_dates(_FIRST_DAY, _LAST_DAY):
+                self.assertIs(func(date), _lookup(table, func, date), "{} {}".format(func.__name__, date))
+
+    def test_out_of_range_falls_back(self):
+        for func, table in _LOOKUP_TABLES.items():
+            with self.assertRaises(NotImplementedError):
+                _lookup(table, func, _LAST_DAY + datetime.timedelta(days=1))
+
+    def test_range_tables_match_helpers(self):
+        start, end = datetime.date(2018, 1, 1), datetime.date(2019, 12, 31)
+        for (func, include_weekends), table in _RANGE_TABLES.items():
+            expected = func(start, end, include_weekends) if func in (get_holidays, get_workdays) else func(start, end)
+            expected = [date.isoformat() for date in expected]
+            self.assertEqual(expected, _lookup_range(table, start, end), func.__name__)
+
+    def test_range_out_of_table_returns_none(self):
+        table = _LOOKUP_TABLES[is_workday]
+        self.assertIsNone(_lookup_range(table, _FIRST_DAY - datetime.timedelta(days=1), _FIRST_DAY))
+        self.assertIsNone(_lookup_range(table, _LAST_DAY, _LAST_DAY + datetime.timedelta(days=1)))
+
+    def test_holiday_detail_matches_helper(self):
+        query = {"start": _FIRST_DAY.isoformat(), "end": _LAST_DAY.isoformat()}
+        results = _holiday_detail_handler(query)["results"]
+        for date, result in zip(get_dates(_FIRST_DAY, _LAST_DAY), results):
+            self.assertEqual(get_holiday_detail(date), (result["is_holiday"], result["holiday_name"]), str(date))
+            self.assertEqual(date.isoformat(), result["date"])
@@ -2,12 +2,15 @@
 from __future__ import absolute_import, unicode_literals
 
 import datetime
+import http.client
 import json
+import socket
 import threading
+import time
 from urllib.request import urlopen
 
 import chinese_calendar
-from chinese_calendar.api import create_server
+from chinese_calendar.api import _CalendarRequestHandler, create_server
 from chinese_calendar.utils import is_a_share_trading_day, is_interbank_trading_day
 
 
@@ -99,3 +102,174 @@ def test_api_supports_existing_judgements_and_range_lists():
     finally:
         server.shutdown()
         thread.join(timeout=1)
+
+
+def test_flag_endpoint_long_range_matches_helpers():
+    server, thread = _start_server()
+    try:
+        port = server.server_address[1]
+        with urlopen(f"http://127.0.0.1:{port}/api/workdays?start=2018-01-01&end=2018-12-31") as response:
+            payload = json.load(response)["results"]
+        dates = chinese_calendar.get_dates(datetime.date(2018, 1, 1), datetime.date(2018, 12, 31))
+        expected = [{"date": date.isoformat(), "is_workday": chinese_calendar.is_workday(date)} for date in dates]
+        assert payload == expected
+    finally:
+        server.shutdown()
+        thread.join(timeout=1)
+
+
+def test_api_keeps_connection_alive():
+    server, thread = _start_server()
+    try:
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        try:
+            for _ in range(2):
+                connection.request("GET", "/api/health")
+                response = connection.getresponse()
+                assert response.getheader("Connection") == "keep-alive"
+                assert json.loads(response.read())["status"] == "ok"
+        finally:
+            connection.close()
+    finally:
+        server.shutdown()
+        thread.join(timeout=1)
+
+
+def test_api_serves_with_bounded_workers():
+    server = create_server(host="127.0.0.1", port=0, workers=1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        port = server.server_address[1]
+        for _ in range(3):
+            with urlopen(f"http://127.0.0.1:{port}/api/health") as response:
+                assert json.load(response)["status"] == "ok"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=1)
+
+
+def test_api_accepts_fragment_and_absolute_form_targets():
+    server, thread = _start_server()
+    try:
+        port = server.server_address[1]
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        try:
+            connection.request("GET", "/api/workdays?dates=2018-02-11#frag")
+            response = connection.getresponse()
+            assert response.status == 200
+            assert json.loads(response.read())["results"] == [{"date": "2018-02-11", "is_workday": True}]
+
+            connection.request("GET", f"http://127.0.0.1:{port}/api/health")
+            response = connection.getresponse()
+            assert response.status == 200
+            assert json.loads(response.read())["status"] == "ok"
+        finally:
+            connection.close()
+    finally:
+        server.shutdown()
+        thread.join(timeout=1)
+
+
+def test_idle_keep_alive_connections_do_not_starve_workers():
+    workers = 2
+    server = create_server(host="127.0.0.1", port=0, workers=workers)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    port = server.server_address[1]
+    idle_connections = [http.client.HTTPConnection("127.0.0.1", port) for _ in range(workers)]
+    try:
+        connection_headers = []
+        for connection in idle_connections:
+            connection.request("GET", "/api/health")
+            response = connection.getresponse()
+            response.read()
+            connection_headers.append(response.getheader("Connection"))
+        # the connection that fills the pool is closed instead of being kept alive
+        assert connection_headers == ["keep-alive"] * (workers - 1) + ["close"]
+
+        started = time.monotonic()
+        with urlopen(f"http://127.0.0.1:{port}/api/health", timeout=10) as response:
+            assert json.load(response)["status"] == "ok"
+        assert time.monotonic() - started < _CalendarRequestHandler.keep_alive_timeout + 1
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=1)
+        for connection in idle_connections:
+            connection.close()
+
+
+def test_server_close_releases_idle_keep_alive_workers():
+    server = create_server(host="127.0.0.1", port=0, workers=1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+    try:
+        connection.request("GET", "/api/health")
+        connection.getresponse().read()
+
+        server.shutdown()
+        thread.join(timeout=1)
+        started = time.monotonic()
+        server.server_close()
+        server._executor.shutdown(wait=True)
+        assert time.monotonic() - started < 1
+    finally:
+        connection.close()
+
+
+def test_first_request_is_not_subject_to_keep_alive_timeout():
+    server, thread = _start_server()
+    try:
+        with socket.create_connection(("127.0.0.1", server.server_address[1]), timeout=10) as connection:
+            time.sleep(_CalendarRequestHandler.keep_alive_timeout + 0.5)
+            connection.sendall(b"GET /api/health HTTP/1.1\r\nHost: 127.0.0.1\r\nConnection: close\r\n\r\n")
+            response = b""
+            while True:
+                chunk = connection.recv(4096)
+                if not chunk:
+                    break
+                response += chunk
+        assert response.startswith(b"HTTP/1.1 200 ")
+    finally:
+        server.shutdown()
+        thread.join(timeout=1)
+
+
+def test_polling_keep_alive_clients_do_not_lock_out_new_clients():
+    workers = 2
+    server = create_server(host="127.0.0.1", port=0, workers=workers)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    port = server.server_address[1]
+    stop = threading.Event()
+
+    def poll():
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        try:
+            while not stop.is_set():
+                try:
+                    connection.request("GET", "/api/health")
+                    connection.getresponse().read()
+                except (OSError, http.client.HTTPException):
+                    connection.close()
+                stop.wait(0.2)
+        finally:
+            connection.close()
+
+    pollers = [threading.Thread(target=poll, daemon=True) for _ in range(workers)]
+    for poller in pollers:
+        poller.start()
+    try:
+        time.sleep(0.5)
+        with urlopen(f"http://127.0.0.1:{port}/api/health", timeout=5) as response:
+            assert json.load(response)["status"] == "ok"
+    finally:
+        stop.set()
+        for poller in pollers:
+            poller.join(timeout=5)
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=1)